@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 from typing import List
 from types import MappingProxyType
-import json
+import numpy as np
+import orjson
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk
 import os
 
 CONTROL_POINT_TEMPLATE = MappingProxyType(
@@ -71,6 +73,47 @@ DISPLAY_TEMPLATE = MappingProxyType(
 )
 
 
+def _position_list(position) -> list:
+    """Positions may be assigned as arrays; the markup always holds a plain list."""
+    return position.tolist() if hasattr(position, "tolist") else position
+
+
+def _compile_markup_builder(num_points: int):
+    """Generate a function that builds the markup dict for num_points control points.
+
+    Every template entry is written into the generated source as a literal, so building
+    the dict needs no template copies and each call gets fresh nested lists.
+    """
+
+    def literal(template, **fields):
+        items = (f"{k!r}: {fields.get(k, repr(v))}" for k, v in template.items())
+        return "{" + ", ".join(items) + "}"
+
+    control_points = ", ".join(
+        literal(
+            CONTROL_POINT_TEMPLATE,
+            id=f'f"{{cps[{i}].id}}"',
+            label=f"cps[{i}].label",
+            description=f"cps[{i}].description",
+            position=f"_as_list(cps[{i}].position)",
+        )
+        for i in range(num_points)
+    )
+    markup = literal(
+        MARKUP_TEMPLATE,
+        coordinateSystem="coordinate_system",
+        controlPoints=f"[{control_points}]",
+        display=literal(DISPLAY_TEMPLATE, color="color"),
+    )
+    source = (
+        "def build(cps, color, coordinate_system):\n"
+        f"    return {{'@schema': {SCHEMA!r}, 'markups': [{markup}]}}\n"
+    )
+    namespace = {"_as_list": _position_list}
+    exec(source, namespace)
+    return namespace["build"]
+
+
 @dataclass
 class ControlPoint:
     position: List[float]
@@ -79,29 +122,36 @@ class ControlPoint:
     description: str = ""
 
     def __post_init__(self):
-        self.position = [float(coord) for coord in self.position]
-        if len(self.position) != 3:
+        position = np.asarray(self.position, dtype=np.float64)
+        if position.shape != (3,):
             raise ValueError("Position must be a list of three floats")
+        self.position = position.tolist()
 
     def to_dict(self) -> dict:
-        d = CONTROL_POINT_TEMPLATE.copy()
-        d.update(
-            {
-                "id": f"{self.id}",
-                "label": self.label,
-                "description": self.description,
-                "position": self.position,
-            }
-        )
-        return d
+        return {
+            **CONTROL_POINT_TEMPLATE,
+            "id": f"{self.id}",
+            "label": self.label,
+            "description": self.description,
+            "position": _position_list(self.position),
+        }
+
+    @classmethod
+    def _unchecked(
+        cls, position, label: str, id: int, description: str
+    ) -> "ControlPoint":
+        """Build a control point from trusted markup data, skipping validation."""
+        obj = cls.__new__(cls)
+        obj.position = np.asarray(position, dtype=np.float64).tolist()
+        obj.label = label
+        obj.id = id
+        obj.description = description
+        return obj
 
     @staticmethod
     def from_dict(d: dict) -> "ControlPoint":
-        return ControlPoint(
-            position=d["position"],
-            label=d["label"],
-            id=int(d["id"]),
-            description=d["description"],
+        return ControlPoint._unchecked(
+            d["position"], d["label"], int(d["id"]), d["description"]
         )
 
 
@@ -111,47 +161,67 @@ class Fiducials:
     color: List[float] = field(default_factory=lambda: [0.4, 1.0, 1.0])
     coordinate_system: str = "LPS"
 
+    # Markup builders specialized by number of control points, compiled on first use.
+    _builders = {}
+
     def to_dict(self) -> dict:
-        d = MARKUP_TEMPLATE.copy()
-        d.update(
-            {
-                "coordinateSystem": self.coordinate_system,
-                "controlPoints": [cp.to_dict() for cp in self.control_points],
-            }
-        )
-        d["display"] = DISPLAY_TEMPLATE.copy()
-        d["display"].update({"color": self.color})
-        return {"@schema": SCHEMA, "markups": [d]}
+        num_points = len(self.control_points)
+        builder = Fiducials._builders.get(num_points)
+        if builder is None:
+            builder = Fiducials._builders[num_points] = _compile_markup_builder(num_points)
+        return builder(self.control_points, self.color, self.coordinate_system)
 
     def to_file(self, filename: str) -> None:
         file_dir = os.path.dirname(filename)
         if not os.path.exists(file_dir):
             os.makedirs(file_dir, exist_ok=True)
-        with open(filename, "w") as file:
-            json.dump(self.to_dict(), file, indent=4)
+        with open(filename, "wb") as file:
+            file.write(
+                orjson.dumps(
+                    self.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
 
     def set_coordinate_system(self, coordinate_system: str) -> None:
         if coordinate_system not in ["LPS", "RAS"]:
             raise ValueError("Coordinate system must be either 'LPS' or 'RAS'")
         if self.coordinate_system != coordinate_system:
-            for cp in self.control_points:
-                cp.position = [-cp.position[0], -cp.position[1], cp.position[2]]
+            if self.control_points:
+                positions = np.stack([cp.position for cp in self.control_points])
+                positions[:, :2] *= -1
+                for cp, position in zip(self.control_points, positions.tolist()):
+                    cp.position = position
             self.coordinate_system = coordinate_system
 
     def get_actors(self, size=1) -> List[vtk.vtkActor]:
-        """Get vtk actors for the control points."""
-        actors = []
-        for cp in self.control_points:
-            sphere_source = vtk.vtkSphereSource()
-            sphere_source.SetCenter(cp.position)
-            sphere_source.SetRadius(size)
-            mapper = vtk.vtkPolyDataMapper()
-            mapper.SetInputConnection(sphere_source.GetOutputPort())
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-            actor.GetProperty().SetColor(self.color)
-            actors.append(actor)
-        return actors
+        """Get vtk actors for the control points.
+
+        All points share one sphere source drawn through a glyph mapper, so the
+        sphere is tessellated once and rendered in a single instanced draw call.
+        """
+        positions = np.array([cp.position for cp in self.control_points], dtype=np.float64)
+        points = vtk.vtkPoints()
+        points.SetData(numpy_to_vtk(positions.reshape(-1, 3), deep=True))
+        poly_data = vtk.vtkPolyData()
+        poly_data.SetPoints(points)
+        sphere_source = vtk.vtkSphereSource()
+        sphere_source.SetRadius(size)
+        mapper = vtk.vtkGlyph3DMapper()
+        mapper.SetInputData(poly_data)
+        mapper.SetSourceConnection(sphere_source.GetOutputPort())
+        mapper.ScalingOff()
+        actor = vtk.vtkActor()
+        actor.SetMapper(mapper)
+        actor.GetProperty().SetColor(self.color)
+        return [actor]
+
+    def get_assembly(self, size=1) -> vtk.vtkAssembly:
+        """Get a single vtk assembly holding the control point actors."""
+        assembly = vtk.vtkAssembly()
+        for actor in self.get_actors(size=size):
+            assembly.AddPart(actor)
+        return assembly
 
     def print(self) -> None:
         """Print the control points."""
@@ -170,11 +240,8 @@ class Fiducials:
     @staticmethod
     def from_dict(data: dict) -> "Fiducials":
         control_points = [
-            ControlPoint(
-                position=cp["position"],
-                label=cp["label"],
-                id=cp["id"],
-                description=cp["description"],
+            ControlPoint._unchecked(
+                cp["position"], cp["label"], int(cp["id"]), cp["description"]
             )
             for cp in data["markups"][0]["controlPoints"]
         ]
@@ -190,6 +257,6 @@ class Fiducials:
     def from_file(filename: str) -> "Fiducials":
         if not os.path.exists(filename):
             raise FileNotFoundError(f"File {filename} does not exist")
-        with open(filename, "r") as file:
-            data = json.load(file)
+        with open(filename, "rb") as file:
+            data = orjson.loads(file.read())
         return Fiducials.from_dict(data)
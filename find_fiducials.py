@@ -1,15 +1,220 @@
 from fiducials import Fiducials, ControlPoint
-from mesh_helpers import read_as_vtkpolydata, get_mesh_actor
+from mesh_helpers import read_as_vtkpolydata, preview_mesh
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+import numba
 import numpy as np
+import orjson
 import os
+import functools
+import hashlib
 import mediapipe as mp
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
-from scipy import stats
 import argparse
+from dataclasses import dataclass
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 
+# Sidecar file (inside the mesh directory) mapping {num_points: {fingerprint: file name}}
+FINGERPRINT_CACHE_FILE = ".fingerprints.json"
+_mesh_fingerprints = {}
+
+
+def _mesh_fingerprint(points: np.ndarray) -> str:
+    """Cheap identity key for a mesh: a hash of its first 256 vertices."""
+    head = np.ascontiguousarray(points[:256], dtype=np.float32)
+    return hashlib.blake2b(head.tobytes(), digest_size=16).hexdigest()
+
+
+def _parse_mesh_fingerprints(data) -> dict:
+    """Validate a decoded sidecar; anything that isn't {str(int): {str: file name}} raises."""
+    fingerprints = {}
+    for num_points, entries in data.items():
+        if not isinstance(entries, dict):
+            raise ValueError("Fingerprint entries must be a mapping")
+        for fname in entries.values():
+            if not isinstance(fname, str) or os.path.basename(fname) != fname:
+                raise ValueError("Fingerprints must map to file names in the mesh directory")
+        fingerprints[int(num_points)] = entries
+    return fingerprints
+
+
+def _load_mesh_fingerprints(data_dir: str) -> dict:
+    if data_dir not in _mesh_fingerprints:
+        try:
+            with open(os.path.join(data_dir, FINGERPRINT_CACHE_FILE), "rb") as file:
+                _mesh_fingerprints[data_dir] = _parse_mesh_fingerprints(orjson.loads(file.read()))
+        except Exception:
+            # A missing, corrupt or foreign sidecar only costs a full scan
+            _mesh_fingerprints[data_dir] = {}
+    return _mesh_fingerprints[data_dir]
+
+
+def _save_mesh_fingerprints(data_dir: str, fingerprints: dict) -> None:
+    _mesh_fingerprints[data_dir] = fingerprints
+    try:
+        with open(os.path.join(data_dir, FINGERPRINT_CACHE_FILE), "wb") as file:
+            file.write(orjson.dumps(fingerprints, option=orjson.OPT_NON_STR_KEYS))
+    except OSError:
+        pass
+
+
+@numba.njit(cache=True, fastmath=True)
+def _filter_mean(points: np.ndarray, thresh: float):
+    """Mean of the points whose per-axis z-scores are all below thresh.
+
+    Returns (mean, number of points kept). If every point is an outlier, the unfiltered
+    mean is returned with a count of 0.
+    """
+    n, dims = points.shape
+    mean = np.zeros(dims)
+    for i in range(n):
+        for k in range(dims):
+            mean[k] += points[i, k]
+    mean /= n
+    std = np.zeros(dims)
+    for i in range(n):
+        for k in range(dims):
+            std[k] += (points[i, k] - mean[k]) ** 2
+    std = np.sqrt(std / n)
+    kept_sum = np.zeros(dims)
+    num_kept = 0
+    for i in range(n):
+        keep = True
+        for k in range(dims):
+            # Zero spread gives an undefined z-score, which never passes (as with scipy.stats.zscore)
+            if std[k] == 0.0 or abs(points[i, k] - mean[k]) / std[k] >= thresh:
+                keep = False
+                break
+        if keep:
+            num_kept += 1
+            for k in range(dims):
+                kept_sum[k] += points[i, k]
+    if num_kept == 0:
+        return mean, 0
+    return kept_sum / num_kept, num_kept
+
+
+def _make_frame_reader(window: vtk.vtkRenderWindow, image_size: int) -> Callable[..., np.ndarray]:
+    """Return a function reading the window's last render into preallocated buffers.
+
+    The frame is written to `out` if given, otherwise to a scratch buffer that is
+    overwritten by the next read.
+    """
+    rgba = np.empty((image_size, image_size, 4), dtype=np.uint8)
+    rgba_vtk = numpy_to_vtk(rgba.reshape(-1, 4), deep=False, array_type=vtk.VTK_UNSIGNED_CHAR)
+    scratch = np.empty((image_size, image_size, 3), dtype=np.uint8)
+
+    def read_frame(out=None):
+        if out is None:
+            out = scratch
+        window.GetRGBACharPixelData(0, 0, image_size - 1, image_size - 1, 1, rgba_vtk)
+        # VTK rows start at the bottom; MediaPipe expects a contiguous top-down RGB frame
+        np.copyto(out, rgba[::-1, :, :3])
+        return out
+
+    return read_frame
+
+
+@dataclass
+class _RenderSession:
+    """Offscreen window with the textured mesh imported once, shared by every rendering pass."""
+
+    window: vtk.vtkRenderWindow
+    renderer: vtk.vtkRenderer
+    camera: vtk.vtkCamera
+    read_frame: Callable[..., np.ndarray]
+    # Current camera azimuth in degrees, relative to the imported view
+    azimuth: float = 0.0
+
+    def rotate_to(self, z: float) -> None:
+        """Rotate the camera to azimuth z without rendering."""
+        self.camera.OrthogonalizeViewUp()
+        self.camera.Azimuth(z - self.azimuth)
+        self.azimuth = z
+
+    def render_at(self, z: float) -> None:
+        """Rotate the camera to azimuth z and render the window."""
+        self.rotate_to(z)
+        self.window.Render()
+
+
+@functools.lru_cache(maxsize=1)
+def _import_textured_mesh(mesh_path: str, mtl_path: str, texture_path: str) -> tuple:
+    """Parse an .obj with its .mtl and textures once, returning the imported actors.
+
+    The actors are not rendered; sessions build their own actors from them so each
+    render window keeps its own graphics resources. Only the latest mesh is kept, since
+    the reuse is between the sessions of one find_fiducials call and scans are large.
+    """
+    importer = vtk.vtkOBJImporter()
+    importer.SetFileName(mesh_path)
+    importer.SetFileNameMTL(mtl_path)
+    importer.SetTexturePath(texture_path)
+    importer.Update()
+    actors = importer.GetRenderer().GetActors()
+    actors.InitTraversal()
+    return tuple(actors.GetNextActor() for _ in range(actors.GetNumberOfItems()))
+
+
+def _copy_imported_actor(imported: vtk.vtkActor) -> vtk.vtkActor:
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.ShallowCopy(imported.GetMapper())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    actor.GetProperty().DeepCopy(imported.GetProperty())
+    imported_texture = imported.GetTexture()
+    if imported_texture is not None:
+        image_source = imported_texture.GetInputAlgorithm()
+        image_source.Update()
+        texture = vtk.vtkTexture()
+        texture.SetInputData(image_source.GetOutputDataObject(0))
+        texture.SetInterpolate(imported_texture.GetInterpolate())
+        texture.SetRepeat(imported_texture.GetRepeat())
+        texture.SetEdgeClamp(imported_texture.GetEdgeClamp())
+        texture.SetMipmap(imported_texture.GetMipmap())
+        actor.SetTexture(texture)
+    return actor
+
+
+def _make_render_session(mesh_path: str, mtl_path: str, texture_path: str, image_size: int) -> _RenderSession:
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(image_size, image_size)
+    renderer = vtk.vtkRenderer()
+    window.AddRenderer(renderer)
+    lights = [
+        {'pos': (0, 0, 1), 'color': (1, 1, 1)},
+        {'pos': (0, 1, 0), 'color': (0.5, 0.5, 0.5)},
+        {'pos': (1, 0, 0), 'color': (0.3, 0.3, 0.3)},
+        {'pos': (-1, 0, 0), 'color': (0.3, 0.3, 0.3)}
+    ]
+    for light_cfg in lights:
+        light = vtk.vtkLight()
+        light.SetPosition(*light_cfg['pos'])
+        light.SetFocalPoint(0, 0, 0)
+        light.SetColor(*light_cfg['color'])
+        light.SetIntensity(1.2)
+        renderer.AddLight(light)
+    for imported in _import_textured_mesh(mesh_path, mtl_path, texture_path):
+        renderer.AddActor(_copy_imported_actor(imported))
+    renderer.SetBackground(1, 1, 1)
+    # Azimuth orbits the focal point at a fixed distance, so the camera is fitted to the
+    # bounds once; the clipping range is widened to cover the mesh from every side
+    camera = renderer.GetActiveCamera()
+    renderer.ResetCamera()
+    renderer.ResetCameraClippingRange()
+    near, far = camera.GetClippingRange()
+    camera.SetClippingRange(near * 0.5, far * 2)
+    return _RenderSession(
+        window=window,
+        renderer=renderer,
+        camera=camera,
+        read_frame=_make_frame_reader(window, image_size),
+    )
+
 
 def find_fiducials(mesh: vtk.vtkPolyData) -> Fiducials:
     """
@@ -29,6 +234,7 @@ def find_fiducials(mesh: vtk.vtkPolyData) -> Fiducials:
     num_views = 16
     image_size = 800
     sweep_size = 5
+    sweep_image_size = 256
     filter_thresh = 1.0
     model_path = os.path.join("mediapipe", "face_landmarker.task")
     
@@ -55,24 +261,49 @@ def find_fiducials(mesh: vtk.vtkPolyData) -> Fiducials:
             return None
         mesh_points = mesh.GetPoints()
         num_points = mesh_points.GetNumberOfPoints()
-        mesh_arr = np.array([mesh_points.GetPoint(i) for i in range(num_points)])
-        for fname in os.listdir(data_dir):
-            if not fname.endswith(".obj"):
-                continue
-            candidate_path = os.path.join(data_dir, fname)
+        mesh_arr = vtk_to_numpy(mesh_points.GetData())
+        mesh_mean = mesh_arr.mean(axis=0)
+        mesh_bounds = mesh.GetBounds()
+        fingerprint = _mesh_fingerprint(mesh_arr)
+
+        def read_candidate(candidate_path):
             try:
                 candidate_mesh = read_as_vtkpolydata(candidate_path)
-                c_points = candidate_mesh.GetPoints()
-                if c_points.GetNumberOfPoints() != num_points:
-                    continue
-                c_arr = np.array([c_points.GetPoint(i) for i in range(num_points)])
-                # Use a quick hash or mean check for speed
-                if np.allclose(np.mean(mesh_arr, axis=0), np.mean(c_arr, axis=0), atol=1e-5):
-                    if np.allclose(mesh_arr, c_arr, atol=1e-5):
-                        return candidate_path
+                return candidate_mesh, vtk_to_numpy(candidate_mesh.GetPoints().GetData())
             except Exception:
+                return None, None
+
+        def matches(candidate_mesh, c_arr):
+            # Cheapest checks first: point count, cached bounds and mean before comparing every point
+            return (
+                c_arr.shape == mesh_arr.shape
+                and np.allclose(mesh_bounds, candidate_mesh.GetBounds(), atol=1e-5)
+                and np.allclose(mesh_mean, c_arr.mean(axis=0), atol=1e-5)
+                and np.allclose(mesh_arr, c_arr, atol=1e-5)
+            )
+
+        # Fast path: a known fingerprint only needs its one candidate verified
+        fname = _load_mesh_fingerprints(data_dir).get(num_points, {}).get(fingerprint)
+        if fname is not None:
+            candidate_path = os.path.join(data_dir, fname)
+            candidate_mesh, c_arr = read_candidate(candidate_path)
+            if c_arr is not None and matches(candidate_mesh, c_arr):
+                return candidate_path
+
+        # Cold path: read every candidate once and rebuild the fingerprint cache
+        fingerprints = {}
+        match = None
+        with os.scandir(data_dir) as entries:
+            candidates = sorted((e.name, e.path) for e in entries if e.name.endswith(".obj"))
+        for fname, candidate_path in candidates:
+            candidate_mesh, c_arr = read_candidate(candidate_path)
+            if c_arr is None:
                 continue
-        return None
+            fingerprints.setdefault(len(c_arr), {})[_mesh_fingerprint(c_arr)] = fname
+            if match is None and matches(candidate_mesh, c_arr):
+                match = candidate_path
+        _save_mesh_fingerprints(data_dir, fingerprints)
+        return match
 
     # --- Infer mesh file path (required for .mtl and texture) ---
     mesh_path = guess_mesh_path_from_points(mesh)
@@ -83,220 +314,149 @@ def find_fiducials(mesh: vtk.vtkPolyData) -> Fiducials:
     texture_path = os.path.join(os.path.dirname(mesh_path))
 
     # --- Setup MediaPipe detector ---
-    base_options = python.BaseOptions(model_asset_path=model_path)
-    options = vision.FaceLandmarkerOptions(
-        base_options=base_options,
-        num_faces=1,
-        min_face_detection_confidence=0.7,
-        min_face_presence_confidence=0.7,
-        min_tracking_confidence=0.7
-    )
-    detector = vision.FaceLandmarker.create_from_options(options)
+    # Every view is an unrelated still, so IMAGE mode runs full detection on each frame
+    # instead of tracking the face across them; prefer the GPU delegate when available
+    def create_detector(delegate):
+        base_options = python.BaseOptions(model_asset_path=model_path, delegate=delegate)
+        options = vision.FaceLandmarkerOptions(
+            base_options=base_options,
+            running_mode=vision.RunningMode.IMAGE,
+            num_faces=1,
+            min_face_detection_confidence=0.7,
+            min_face_presence_confidence=0.7,
+            min_tracking_confidence=0.7
+        )
+        return vision.FaceLandmarker.create_from_options(options)
+
+    try:
+        detector = create_detector(python.BaseOptions.Delegate.GPU)
+    except (RuntimeError, NotImplementedError):
+        detector = create_detector(python.BaseOptions.Delegate.CPU)
+    def detect_landmarks(image):
+        rgb_frame = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
+        return detector.detect(rgb_frame)
+
     mp_face_detection = mp.solutions.face_detection
     testdetector = mp_face_detection.FaceDetection(model_selection=0, min_detection_confidence=0.95)
 
+    # Warm up both graphs on a blank frame so the first real view doesn't pay for initialisation
+    blank_frame = np.zeros((image_size, image_size, 3), dtype=np.uint8)
+    detect_landmarks(blank_frame)
+    testdetector.process(blank_frame)
+
+    # --- Build the render sessions ---
+    # The sweep only needs a yes/no face detection, so it renders smaller frames than the picking views
+    sweep_session = _make_render_session(mesh_path, mtl_path, texture_path, sweep_image_size)
+    session = _make_render_session(mesh_path, mtl_path, texture_path, image_size)
+
     # --- Find viable Z rotations ---
-    def find_viable_z_rots(mesh_path, detector, stepZ=sweep_size, verbose=False, image_size=image_size):
-        window = vtk.vtkRenderWindow()
-        window.SetOffScreenRendering(1)
-        window.SetSize(image_size, image_size)
-        renderer = vtk.vtkRenderer()
-        window.AddRenderer(renderer)
-        lights = [
-            {'pos': (0, 0, 1), 'color': (1, 1, 1)},
-            {'pos': (0, 1, 0), 'color': (0.5, 0.5, 0.5)},
-            {'pos': (1, 0, 0), 'color': (0.3, 0.3, 0.3)},
-            {'pos': (-1, 0, 0), 'color': (0.3, 0.3, 0.3)}
-        ]
-        for light_cfg in lights:
-            light = vtk.vtkLight()
-            light.SetPosition(*light_cfg['pos'])
-            light.SetFocalPoint(0, 0, 0)
-            light.SetColor(*light_cfg['color'])
-            light.SetIntensity(1.2)
-            renderer.AddLight(light)
-        importer = vtk.vtkOBJImporter()
-        importer.SetFileName(mesh_path)
-        importer.SetFileNameMTL(mtl_path)
-        importer.SetTexturePath(texture_path)
-        importer.SetRenderWindow(window)
-        importer.Update()
-        renderer.SetBackground(1, 1, 1)
-        prevDetect = False
-        prevprevDetect = False
-        minZrot = 0
-        maxZrot = 0
-        currZ = 0
-        numsteps = round(360/stepZ)
-        for z in range(numsteps):
-            renderer.ResetCamera()
-            renderer.GetActiveCamera().Zoom(1.0)
-            renderer.GetActiveCamera().OrthogonalizeViewUp()
-            renderer.GetActiveCamera().Azimuth(stepZ)
-            currZ = currZ + stepZ
-            renderer.ResetCameraClippingRange()
-            window.Render()
-            windowToImageFilter = vtk.vtkWindowToImageFilter()
-            windowToImageFilter.SetInput(window)
-            windowToImageFilter.Update()
-            vtk_image = windowToImageFilter.GetOutput()
-            scalars = vtk_image.GetPointData().GetScalars()
-            image = np.frombuffer(scalars, dtype=np.uint8)
-            image = image.reshape(image_size, image_size, 3)
-            image = np.flipud(image)
-            # Patch: ensure correct format for MediaPipe
-            if image.shape[-1] > 3:
-                image = image[..., :3]
-            image = np.ascontiguousarray(image, dtype=np.uint8)
-            rgb_frame = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
-            detection_result = detector.detect(rgb_frame)
-            currDetect = bool(detection_result.face_landmarks)
-            if prevprevDetect and (not prevDetect) and (not currDetect):
-                maxZrot = currZ-2*stepZ
-                break
-            prevprevDetect = prevDetect
-            prevDetect = currDetect
-        prevDetect = False
-        prevprevDetect = False
-        currZ = maxZrot
-        for z in range(numsteps):
-            renderer.ResetCamera()
-            renderer.GetActiveCamera().Zoom(1.0)
-            renderer.GetActiveCamera().OrthogonalizeViewUp()
-            renderer.GetActiveCamera().Azimuth(-stepZ)
-            currZ = currZ - stepZ
-            renderer.ResetCameraClippingRange()
-            window.Render()
-            windowToImageFilter = vtk.vtkWindowToImageFilter()
-            windowToImageFilter.SetInput(window)
-            windowToImageFilter.Update()
-            vtk_image = windowToImageFilter.GetOutput()
-            scalars = vtk_image.GetPointData().GetScalars()
-            image = np.frombuffer(scalars, dtype=np.uint8)
-            image = image.reshape(image_size, image_size, 3)
-            image = np.flipud(image)
-            # Patch: ensure correct format for MediaPipe
-            if image.shape[-1] > 3:
-                image = image[..., :3]
-            image = np.ascontiguousarray(image, dtype=np.uint8)
-            rgb_frame = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
-            detection_result = detector.detect(rgb_frame)
-            currDetect = bool(detection_result.face_landmarks)
-            if prevprevDetect and (not prevDetect) and (not currDetect):
-                minZrot = currZ+2*stepZ
+    def find_viable_z_rots(session, stepZ=sweep_size, coarse_step=45):
+        def face_detected(z):
+            session.render_at(z)
+            return bool(detect_landmarks(session.read_frame()).face_landmarks)
+
+        def find_edge(inside, outside):
+            # Bisect between a detected and an undetected azimuth down to stepZ precision
+            while abs(outside - inside) > stepZ:
+                middle = (inside + outside) / 2
+                if face_detected(middle):
+                    inside = middle
+                else:
+                    outside = middle
+            return inside
+
+        # Coarse pass around the full circle; only fall back to stepZ spacing if it sees no face
+        for step in (coarse_step, stepZ):
+            angles = np.arange(0, 360, step)
+            detected = [face_detected(z) for z in angles]
+            if any(detected):
                 break
-            prevprevDetect = prevDetect
-            prevDetect = currDetect
+        else:
+            return 0, 0
+        if all(detected):
+            # Stop one view short of the full circle so -180 and 180 aren't both rendered
+            return 180 - 360 / num_views, -180
+        # Longest circular run of detections, as (length, start index)
+        runs = []
+        for i in range(len(angles)):
+            if detected[i] and not detected[i - 1]:
+                length = 1
+                while detected[(i + length) % len(angles)]:
+                    length += 1
+                runs.append((length, i))
+        length, start = max(runs)
+        first = angles[start]
+        last = first + (length - 1) * step
+        minZrot = find_edge(first, first - step)
+        maxZrot = find_edge(last, last + step)
+        if (minZrot + maxZrot) / 2 > 180:
+            minZrot -= 360
+            maxZrot -= 360
         return maxZrot, minZrot
 
-    maxZrot, minZrot = find_viable_z_rots(mesh_path, detector, sweep_size, False, image_size)
+    maxZrot, minZrot = find_viable_z_rots(sweep_session, sweep_size)
     z_rotations = np.linspace(minZrot, maxZrot, num_views)
 
-    # --- Render all views ---
-    def render_images_all(mesh_path, z_rotations, image_size=image_size):
-        images = []
-        stepZ = z_rotations[1] - z_rotations[0]
-        window = vtk.vtkRenderWindow()
-        window.SetOffScreenRendering(1)
-        window.SetSize(image_size, image_size)
-        renderer = vtk.vtkRenderer()
-        window.AddRenderer(renderer)
-        lights = [
-            {'pos': (0, 0, 1), 'color': (1, 1, 1)},
-            {'pos': (0, 1, 0), 'color': (0.5, 0.5, 0.5)},
-            {'pos': (1, 0, 0), 'color': (0.3, 0.3, 0.3)},
-            {'pos': (-1, 0, 0), 'color': (0.3, 0.3, 0.3)}
-        ]
-        for light_cfg in lights:
-            light = vtk.vtkLight()
-            light.SetPosition(*light_cfg['pos'])
-            light.SetFocalPoint(0, 0, 0)
-            light.SetColor(*light_cfg['color'])
-            light.SetIntensity(1.2)
-            renderer.AddLight(light)
-        importer = vtk.vtkOBJImporter()
-        importer.SetFileName(mesh_path)
-        importer.SetFileNameMTL(mtl_path)
-        importer.SetTexturePath(texture_path)
-        importer.SetRenderWindow(window)
-        importer.Update()
-        renderer.SetBackground(1, 1, 1)
-        renderer.ResetCamera()
-        renderer.GetActiveCamera().Zoom(1.0)
-        renderer.GetActiveCamera().OrthogonalizeViewUp()
-        renderer.GetActiveCamera().Azimuth(z_rotations[0] - stepZ)
-        for z in z_rotations:
-            renderer.ResetCamera()
-            renderer.GetActiveCamera().Zoom(1.0)
-            renderer.GetActiveCamera().OrthogonalizeViewUp()
-            renderer.GetActiveCamera().Azimuth(stepZ)
-            renderer.ResetCameraClippingRange()
-            window.Render()
-            windowToImageFilter = vtk.vtkWindowToImageFilter()
-            windowToImageFilter.SetInput(window)
-            windowToImageFilter.Update()
-            vtk_image = windowToImageFilter.GetOutput()
-            scalars = vtk_image.GetPointData().GetScalars()
-            image = np.frombuffer(scalars, dtype=np.uint8)
-            image = image.reshape(image_size, image_size, 3)
-            image = np.flipud(image)
-            # Patch: ensure correct format for MediaPipe
-            if image.shape[-1] > 3:
-                image = image[..., :3]
-            image = np.ascontiguousarray(image, dtype=np.uint8)
-            images.append(image)
-        return np.stack(images, axis=0)
-
-    images = render_images_all(mesh_path, z_rotations, image_size)
+    # --- Render all views and detect landmarks ---
+    # A single worker runs the detectors one view at a time (neither graph is thread-safe)
+    # while the main thread, which owns the VTK context, renders the next view.
+    def detect_view(image):
+        return detect_landmarks(image), testdetector.process(image)
+
+    def render_images_all(session, z_rotations):
+        images = np.empty((len(z_rotations), image_size, image_size, 3), dtype=np.uint8)
+        with ThreadPoolExecutor(max_workers=1) as detection_pool:
+            pending_detections = []
+            for view_id, z in enumerate(z_rotations):
+                session.render_at(z)
+                session.read_frame(out=images[view_id])
+                pending_detections.append(detection_pool.submit(detect_view, images[view_id]))
+            detections = [future.result() for future in pending_detections]
+        detection_results = [landmarks for landmarks, _ in detections]
+        test_results = [faces for _, faces in detections]
+        return images, detection_results, test_results
+
+    images, detection_results, test_results = render_images_all(session, z_rotations)
 
     # --- Extract fiducials ---
     fiducial_points = {label: [] for label in landmark_map}
-    picker = vtk.vtkCellPicker()
-    picker.SetTolerance(0.005)
+    # The input mesh matches the imported geometry, so rays can be cast against it directly
+    obb_tree = vtk.vtkOBBTree()
+    obb_tree.SetDataSet(mesh)
+    obb_tree.BuildLocator()
+    hit_points = vtk.vtkPoints()
+    renderer = session.renderer
+
+    def pick(display_x, display_y):
+        """Return the first surface point along the view ray through a display pixel, or None."""
+        ray = []
+        for depth in (0.0, 1.0):
+            renderer.SetDisplayPoint(display_x, display_y, depth)
+            renderer.DisplayToWorld()
+            x, y, z, w = renderer.GetWorldPoint()
+            ray.append((x / w, y / w, z / w))
+        if obb_tree.IntersectWithLine(ray[0], ray[1], hit_points, None) == 0:
+            return None
+        return hit_points.GetPoint(0)
+
     stepZ = z_rotations[1] - z_rotations[0]
-    window = vtk.vtkRenderWindow()
-    window.SetOffScreenRendering(1)
-    window.SetSize(image_size, image_size)
-    renderer = vtk.vtkRenderer()
-    window.AddRenderer(renderer)
-    importer = vtk.vtkOBJImporter()
-    importer.SetFileName(mesh_path)
-    importer.SetFileNameMTL(mtl_path)
-    importer.SetTexturePath(texture_path)
-    importer.SetRenderWindow(window)
-    importer.Update()
-    renderer.SetBackground(1, 1, 1)
-    renderer.ResetCamera()
-    renderer.GetActiveCamera().Zoom(1.0)
-    renderer.GetActiveCamera().OrthogonalizeViewUp()
-    renderer.GetActiveCamera().Azimuth(z_rotations[0] - stepZ)
-    renderer.ResetCameraClippingRange()
-    window.Render()
     currZ = z_rotations[0]
     middleZ = (z_rotations[-1] + z_rotations[0]) / 2
+    landmark_indices = [mp_idx for mp_idx, _ in landmark_map.values()]
     for view_id in range(num_views):
         image = images[view_id]
-        # Patch: ensure correct format for MediaPipe
-        if image.shape[-1] > 3:
-            image = image[..., :3]
-        image = np.ascontiguousarray(image, dtype=np.uint8)
-        rgb_frame = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
-        detection_result = detector.detect(rgb_frame)
-        testdetector_results = testdetector.process(image)
-        renderer.ResetCamera()
-        renderer.GetActiveCamera().Zoom(1.0)
-        renderer.GetActiveCamera().OrthogonalizeViewUp()
-        renderer.GetActiveCamera().Azimuth(stepZ)
-        renderer.ResetCameraClippingRange()
-        window.Render()
+        detection_result = detection_results[view_id]
+        testdetector_results = test_results[view_id]
+        # Picking ray-casts against the OBB tree, so only the camera pose is needed
+        session.rotate_to(z_rotations[view_id])
         currZ = currZ + stepZ
         if not detection_result.face_landmarks:
             continue
         face_landmarks = detection_result.face_landmarks[0]
         h, w, _ = image.shape
-        for label, (mp_idx, fid_id) in landmark_map.items():
-            lm = face_landmarks[mp_idx]
-            image_x, image_y = float(lm.x * w), float(lm.y * h)
+        # Scale the normalized landmarks to pixel coordinates in one step
+        landmark_pixels = np.array([(face_landmarks[i].x, face_landmarks[i].y) for i in landmark_indices]) * (w, h)
+        for label, (image_x, image_y) in zip(landmark_map, landmark_pixels.tolist()):
             y_vtk = image_size - image_y
             # Special handling for tragion
             if label == "left_ear":
@@ -317,28 +477,23 @@ def find_fiducials(mesh: vtk.vtkPolyData) -> Fiducials:
                     Earpoint = mp_face_detection.get_key_point(detection, mp_face_detection.FaceKeyPoint.RIGHT_EAR_TRAGION)
                 image_x, image_y = float(Earpoint.x * w), float(Earpoint.y * h)
                 y_vtk = image_size - image_y
-            picker.Pick(image_x, y_vtk, 0, renderer)
-            point_3d = picker.GetPickPosition()
+            point_3d = pick(image_x, y_vtk)
             if point_3d is not None:
                 fiducial_points[label].append(point_3d)
 
     # --- Filter fiducials ---
     avg_points = {}
     for label, points in fiducial_points.items():
-        points = np.array(points)
+        points = np.array(points, dtype=np.float64)
         if points.size == 0:
             warnings.warn(f"No points found for fiducial '{label}'. Skipping this label.")
             continue
         if len(points) == 1:
             avg_point = points[0]
         else:
-            z_scores = np.abs(stats.zscore(points))
-            mask = (z_scores < filter_thresh).all(axis=1)
-            if not np.any(mask):
+            avg_point, num_kept = _filter_mean(points, filter_thresh)
+            if num_kept == 0:
                 warnings.warn(f"All points for fiducial '{label}' filtered out as outliers. Using unfiltered mean.")
-                avg_point = np.mean(points, axis=0)
-            else:
-                avg_point = np.mean(points[mask], axis=0)
         avg_points[label] = avg_point.tolist()
 
     # --- Build Fiducials object ---
@@ -421,18 +576,4 @@ if __name__ == "__main__":
             )
         else:
             reference_fiducials = None
-        renderWindow = vtk.vtkRenderWindow()
-        renderer = vtk.vtkRenderer()
-        renderWindow.AddRenderer(renderer)
-        renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-        renderWindowInteractor.SetRenderWindow(renderWindow)
-        renderer.AddActor(get_mesh_actor(mesh))
-        cp_actors = points.get_actors(size=args.point_size)
-        for cp in cp_actors:
-            renderer.AddActor(cp)
-        if reference_fiducials:
-            cp_actors = reference_fiducials.get_actors(size=args.point_size)
-            for cp in cp_actors:
-                renderer.AddActor(cp)
-        renderWindow.Render()
-        renderWindowInteractor.Start()
+        preview_mesh(mesh, [points, reference_fiducials], size=args.point_size)
@@ -51,7 +51,11 @@ def get_mesh_actor(mesh):
     return actor
 
 
-def preview_mesh(mesh):
+def preview_mesh(mesh, fiducials_list=(), size=0.01):
+    """Show a mesh in an interactive window, optionally with sets of fiducials.
+
+    Entries of fiducials_list that are None are skipped.
+    """
     actor = get_mesh_actor(mesh)
     renderWindow = vtk.vtkRenderWindow()
     renderer = vtk.vtkRenderer()
@@ -59,5 +63,8 @@ def preview_mesh(mesh):
     renderWindowInteractor = vtk.vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
     renderer.AddActor(actor)
+    for fiducials in fiducials_list:
+        if fiducials:
+            renderer.AddActor(fiducials.get_assembly(size=size))
     renderWindow.Render()
     renderWindowInteractor.Start()
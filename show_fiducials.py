@@ -1,6 +1,5 @@
 from fiducials import Fiducials, ControlPoint
-from mesh_helpers import read_as_vtkpolydata, get_mesh_actor
-import vtk
+from mesh_helpers import read_as_vtkpolydata, preview_mesh
 import numpy as np
 import os
 import argparse
@@ -68,16 +67,4 @@ if __name__ == "__main__":
         )
     else:
         reference_fiducials = None
-    renderWindow = vtk.vtkRenderWindow()
-    renderer = vtk.vtkRenderer()
-    renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-    renderWindowInteractor.SetRenderWindow(renderWindow)
-    renderer.AddActor(get_mesh_actor(mesh))
-    for pointset in [output_fiducials, reference_fiducials]:
-        if pointset:
-            cp_actors = pointset.get_actors(size=args.point_size)
-            for cp in cp_actors:
-                renderer.AddActor(cp)
-    renderWindow.Render()
-    renderWindowInteractor.Start()
+    preview_mesh(mesh, [output_fiducials, reference_fiducials], size=args.point_size)